@@ -1,25 +1,287 @@
-from fastapi import FastAPI
+import hashlib
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 
-app = FastAPI(
+import msgspec
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+# Cache lifetimes in seconds; every payload is derived from the URL alone
+_ROOT_MAX_AGE = 60
+_TASK_MAX_AGE = 300
+_SEARCH_MAX_AGE = 60
+
+
+def _cache_control(max_age: int) -> str:
+    """Cache-Control value allowing any cache to store a response for max_age seconds."""
+    return f"public, max-age={max_age}"
+
+
+def _etag(body: bytes) -> str:
+    """
+    Weak ETag fingerprint for a response body.
+
+    Weak because GZipMiddleware may re-encode the body without touching
+    the ETag; a strong validator must differ between content-codings.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates or "*" in candidates
+
+
+def _caching_headers(etag: str, max_age: int) -> dict[str, str]:
+    """ETag and Cache-Control headers shared by 200 and 304 responses."""
+    return {"ETag": etag, "Cache-Control": _cache_control(max_age)}
+
+
+def _json_response(body: bytes, etag: str, max_age: int) -> Response:
+    """200 response for a pre-serialized JSON body with its caching headers."""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=_caching_headers(etag, max_age)
+    )
+
+
+def _not_modified_response(etag: str, max_age: int) -> Response:
+    """Empty 304 response carrying the same caching headers as the 200."""
+    return Response(status_code=304, headers=_caching_headers(etag, max_age))
+
+
+def _conditional_json_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    max_age: int
+) -> Response:
+    """
+    Return body as JSON, or an empty 304 if the client already has this version.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        body: Pre-serialized JSON payload
+        etag: ETag computed from body
+        max_age: Cache-Control max-age in seconds
+
+    Returns:
+        200 response with body and caching headers, or 304 Not Modified
+        with caching headers only
+    """
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return _not_modified_response(etag, max_age)
+    return _json_response(body, etag, max_age)
+
+
+@dataclass(slots=True, frozen=True)
+class StaticRoute:
+    """Pre-built ASGI messages for a GET route whose payload never changes."""
+
+    etag: str
+    start: dict
+    not_modified_start: dict
+    body: dict
+
+
+class TaskManagementAPI(FastAPI):
+    """
+    FastAPI app that answers static GET routes before Starlette runs.
+
+    Paths registered with add_static_route are served straight from a dict
+    of pre-built response messages: no middleware stack, no router regex
+    matching, no dependency resolution. Only If-None-Match is inspected
+    so ETag revalidation keeps working. Every other request (including
+    other methods on a static path) is handled by FastAPI as usual.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.static_routes: dict[str, StaticRoute] = {}
+
+    def add_static_route(self, path: str, body: bytes, etag: str, max_age: int) -> None:
+        """
+        Serve a constant JSON payload for GET path ahead of routing.
+
+        The messages are rendered from the same responses that
+        _conditional_json_response returns, so headers can't drift.
+
+        Args:
+            path: Exact request path
+            body: Pre-serialized JSON payload
+            etag: ETag computed from body
+            max_age: Cache-Control max-age in seconds
+        """
+        ok = _json_response(body, etag, max_age)
+        not_modified = _not_modified_response(etag, max_age)
+        self.static_routes[path] = StaticRoute(
+            etag=etag,
+            start={
+                "type": "http.response.start",
+                "status": ok.status_code,
+                "headers": ok.raw_headers,
+            },
+            not_modified_start={
+                "type": "http.response.start",
+                "status": not_modified.status_code,
+                "headers": not_modified.raw_headers,
+            },
+            body={"type": "http.response.body", "body": ok.body},
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET":
+            route = self.static_routes.get(scope["path"])
+            if route is not None:
+                await self._send_static(route, scope, send)
+                return
+        await super().__call__(scope, receive, send)
+
+    @staticmethod
+    async def _send_static(route: StaticRoute, scope: Scope, send: Send) -> None:
+        """Send a pre-built static response, or 304 if the client's copy is current."""
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+                break
+        if _etag_matches(if_none_match, route.etag):
+            await send(route.not_modified_start)
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send(route.start)
+        await send(route.body)
+
+
+app = TaskManagementAPI(
     title="Task Management API",
     description="A simple API demonstrating FastAPI best practices",
     version="1.0.0"
 )
 
+# Compress larger payloads (mainly /search with long queries) when the client accepts gzip
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+
+class TaskResponse(msgspec.Struct):
+    """Response body for GET /tasks/{task_id}."""
+
+    task_id: int
+    title: str
+    description: str
+    status: str
+    priority: str
+    created_at: str
+
+
+class SearchFilters(msgspec.Struct):
+    """Filters echoed back in a GET /search response."""
+
+    status: str | None
+    limit: int
+    offset: int
+
+
+class SearchResult(msgspec.Struct):
+    """A single task in a GET /search results page."""
 
-@app.get("/")
-async def get_welcome_message():
+    task_id: int
+    title: str
+    status: str
+    relevance_score: float
+
+
+class SearchResponse(msgspec.Struct):
+    """Response body for GET /search."""
+
+    query: str
+    filters: SearchFilters
+    total_results: int
+    results: list[SearchResult]
+
+
+# Reused for every response; msgspec encodes Structs (and plain dicts) in field order
+_JSON_ENCODER = msgspec.json.Encoder()
+
+# The welcome payload never changes, so serialize it once at import time
+_WELCOME_BYTES = _JSON_ENCODER.encode({
+    "message": "Welcome to the Task Management API!",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "status": "operational"
+})
+_WELCOME_ETAG = _etag(_WELCOME_BYTES)
+
+# GET / is answered by TaskManagementAPI before routing; see get_welcome_message
+app.add_static_route("/", _WELCOME_BYTES, _WELCOME_ETAG, _ROOT_MAX_AGE)
+
+
+# Shared string constants reused in every task and search payload
+_PENDING = sys.intern("pending")
+_IN_PROGRESS = sys.intern("in_progress")
+_MEDIUM = sys.intern("medium")
+_CREATED_AT = sys.intern("2026-01-09T00:00:00Z")
+
+_TASK_TITLE_PREFIX = "Task #"
+_TASK_DESCRIPTION_PREFIX = "This is task number "
+
+
+@lru_cache(maxsize=4096)
+def _task_payload(task_id: int) -> tuple[bytes, str]:
+    """Serialize the task payload for task_id, cached for frequently requested IDs."""
+    task_id_str = str(task_id)
+    body = _JSON_ENCODER.encode(TaskResponse(
+        task_id=task_id,
+        title=_TASK_TITLE_PREFIX + task_id_str,
+        description=_TASK_DESCRIPTION_PREFIX + task_id_str,
+        status=_PENDING,
+        priority=_MEDIUM,
+        created_at=_CREATED_AT
+    ))
+    return body, _etag(body)
+
+
+def _build_results(q: str, offset: int, status: str | None) -> list[SearchResult]:
+    """Build the mock search results page; only q, offset and status vary."""
+    return [
+        SearchResult(
+            task_id=offset + 1,
+            title=f"Task matching '{q}'",
+            status=status or _PENDING,
+            relevance_score=0.95
+        ),
+        SearchResult(
+            task_id=offset + 2,
+            title=f"Another task for '{q}'",
+            status=status or _IN_PROGRESS,
+            relevance_score=0.87
+        )
+    ]
+
+
+# Every endpoint returns a ready-made Response of pre-encoded bytes, so FastAPI
+# skips response_model validation and never renders through a response_class;
+# setting response_class (e.g. ORJSONResponse) here would have no effect.
+@app.get("/", response_model=None)
+async def get_welcome_message(request: Request) -> Response:
     """Root endpoint that returns a welcome message"""
-    return {
-        "message": "Welcome to the Task Management API!",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "status": "operational"
-    }
+    # Normally never reached: the static route registered above serves GET "/"
+    # first. Kept so "/" is documented in the OpenAPI schema, and as the
+    # fallback if the static route is removed (covered by the test suite).
+    return _conditional_json_response(
+        request, _WELCOME_BYTES, _WELCOME_ETAG, _ROOT_MAX_AGE
+    )
 
 
-@app.get("/tasks/{task_id}")
-async def get_task_by_id(task_id: int):
+@app.get("/tasks/{task_id}", response_model=None)
+async def get_task_by_id(task_id: int, request: Request) -> Response:
     """
     Get a task by ID using path parameter
 
@@ -27,25 +289,19 @@ async def get_task_by_id(task_id: int):
         task_id: The unique identifier for the task (must be an integer)
 
     Returns:
-        Dictionary containing task details
+        JSON response containing task details
     """
-    return {
-        "task_id": task_id,
-        "title": f"Task #{task_id}",
-        "description": f"This is task number {task_id}",
-        "status": "pending",
-        "priority": "medium",
-        "created_at": "2026-01-09T00:00:00Z"
-    }
+    body, etag = _task_payload(task_id)
+    return _conditional_json_response(request, body, etag, _TASK_MAX_AGE)
 
 
-@app.get("/search")
+@app.get("/search", response_model=None)
 async def search_tasks(
     q: str,
     limit: int = 10,
     offset: int = 0,
     status: str | None = None
-):
+) -> Response:
     """
     Search tasks with query parameters
 
@@ -56,28 +312,20 @@ async def search_tasks(
         status: Optional filter by task status
 
     Returns:
-        Dictionary containing search results and metadata
+        JSON response containing search results and metadata
     """
-    return {
-        "query": q,
-        "filters": {
-            "status": status,
-            "limit": limit,
-            "offset": offset
-        },
-        "total_results": 42,
-        "results": [
-            {
-                "task_id": offset + 1,
-                "title": f"Task matching '{q}'",
-                "status": status or "pending",
-                "relevance_score": 0.95
-            },
-            {
-                "task_id": offset + 2,
-                "title": f"Another task for '{q}'",
-                "status": status or "in_progress",
-                "relevance_score": 0.87
-            }
-        ]
-    }
+    body = _JSON_ENCODER.encode(SearchResponse(
+        query=q,
+        filters=SearchFilters(
+            status=status,
+            limit=limit,
+            offset=offset
+        ),
+        total_results=42,
+        results=_build_results(q, offset, status)
+    ))
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": _cache_control(_SEARCH_MAX_AGE)}
+    )
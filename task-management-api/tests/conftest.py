@@ -5,25 +5,33 @@ This file is automatically loaded by pytest and provides
 shared fixtures available to all test files.
 """
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 from main import app
 
 
-@pytest.fixture
-def client():
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
     """
-    Fixture that provides a TestClient instance.
+    Fixture that provides an async HTTP client bound to the app.
+
+    Session-scoped: the endpoints are stateless, so a single client is
+    shared by every test instead of being rebuilt per test.
 
-    The TestClient handles the application lifecycle automatically,
-    so you don't need to start/stop the server manually.
+    Requests are dispatched in-process through ASGITransport, so you
+    don't need to start/stop the server manually. Tests are collected
+    as coroutines (asyncio_mode = auto) and can run in parallel with
+    pytest-xdist.
 
     Usage:
-        def test_something(client):
-            response = client.get("/endpoint")
+        async def test_something(client):
+            response = await client.get("/endpoint")
             assert response.status_code == 200
     """
-    return TestClient(app)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
 
 
 @pytest.fixture
@@ -10,8 +10,23 @@ Tests follow TDD principles and cover:
 - Agent-specific contract stability
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
+
+from main import app
+
+# Top-level fields each endpoint must always return (agent contract)
+ROOT_FIELDS = frozenset(("message", "version", "docs", "status"))
+TASK_FIELDS = frozenset((
+    "task_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "created_at",
+))
+SEARCH_FIELDS = frozenset(("query", "filters", "total_results", "results"))
 
 
 # ============================================================================
@@ -22,9 +37,9 @@ class TestRootEndpoint:
     """Tests for GET / endpoint."""
 
     @pytest.mark.smoke
-    def test_root_returns_welcome_message(self, client):
+    async def test_root_returns_welcome_message(self, client):
         """GET / should return welcome message with correct structure."""
-        response = client.get("/")
+        response = await client.get("/")
 
         assert response.status_code == 200
 
@@ -34,26 +49,25 @@ class TestRootEndpoint:
         assert data["docs"] == "/docs"
         assert data["status"] == "operational"
 
-    def test_root_returns_json(self, client):
+    async def test_root_returns_json(self, client):
         """GET / should return JSON content type."""
-        response = client.get("/")
+        response = await client.get("/")
 
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/json"
 
-    def test_root_response_schema_stability(self, client):
+    async def test_root_response_schema_stability(self, client):
         """
         GET / response schema should be stable (important for agents).
 
         Agents depend on consistent field names and types.
         """
-        response = client.get("/")
+        response = await client.get("/")
         data = response.json()
 
         # Verify all expected fields exist
-        required_fields = ["message", "version", "docs", "status"]
-        for field in required_fields:
-            assert field in data, f"Required field '{field}' missing from response"
+        missing = ROOT_FIELDS - data.keys()
+        assert not missing, f"Required fields {sorted(missing)} missing from response"
 
         # Verify field types (agents can't handle type changes)
         assert isinstance(data["message"], str)
@@ -61,6 +75,48 @@ class TestRootEndpoint:
         assert isinstance(data["docs"], str)
         assert isinstance(data["status"], str)
 
+    async def test_root_content_length_matches_body(self, client):
+        """GET / headers are pre-built, so Content-Length must match the body."""
+        response = await client.get("/", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert int(response.headers["content-length"]) == len(response.content)
+
+    async def test_root_fallback_route_matches_static_route(self, client, monkeypatch):
+        """
+        Without its static route, GET / should fall back to get_welcome_message.
+
+        The fallback must serve the same body and caching headers as the
+        pre-built static response.
+        """
+        static = await client.get("/", headers={"Accept-Encoding": "identity"})
+
+        monkeypatch.delitem(app.static_routes, "/")
+        fallback = await client.get("/", headers={"Accept-Encoding": "identity"})
+
+        assert fallback.status_code == 200
+        assert fallback.content == static.content
+        for header in ("content-type", "content-length", "etag", "cache-control"):
+            assert fallback.headers[header] == static.headers[header]
+
+        not_modified = await client.get(
+            "/", headers={"If-None-Match": static.headers["etag"]}
+        )
+        assert not_modified.status_code == 304
+
+    @pytest.mark.parametrize("endpoint", ["/", "/tasks/1", "/search?q=test"])
+    async def test_head_handled_consistently(self, client, endpoint):
+        """HEAD should get the same 405 on / as on every other GET route."""
+        response = await client.head(endpoint)
+
+        assert response.status_code == 405
+
+    async def test_root_rejects_other_methods(self, client):
+        """Non-GET requests to / should still be rejected by the router."""
+        response = await client.post("/")
+
+        assert response.status_code == 405
+
 
 # ============================================================================
 # TASKS ENDPOINT TESTS
@@ -70,9 +126,9 @@ class TestTasksEndpoint:
     """Tests for GET /tasks/{task_id} endpoint."""
 
     @pytest.mark.smoke
-    def test_get_task_by_id_success(self, client, sample_task_id):
+    async def test_get_task_by_id_success(self, client, sample_task_id):
         """GET /tasks/{task_id} should return task details."""
-        response = client.get(f"/tasks/{sample_task_id}")
+        response = await client.get(f"/tasks/{sample_task_id}")
 
         assert response.status_code == 200
 
@@ -84,38 +140,32 @@ class TestTasksEndpoint:
         assert data["priority"] == "medium"
         assert "created_at" in data
 
-    def test_get_task_with_different_ids(self, client):
+    async def test_get_task_with_different_ids(self, client):
         """GET /tasks/{task_id} should work with different task IDs."""
         test_ids = [1, 42, 100, 999, 12345]
 
-        for task_id in test_ids:
-            response = client.get(f"/tasks/{task_id}")
+        responses = await asyncio.gather(
+            *(client.get(f"/tasks/{task_id}") for task_id in test_ids)
+        )
 
+        for task_id, response in zip(test_ids, responses):
             assert response.status_code == 200
             data = response.json()
             assert data["task_id"] == task_id
             assert str(task_id) in data["title"]
 
-    def test_get_task_response_schema_stability(self, client):
+    async def test_get_task_response_schema_stability(self, client):
         """
         GET /tasks/{task_id} response schema should be stable.
 
         Critical for agents that depend on consistent field structure.
         """
-        response = client.get("/tasks/1")
+        response = await client.get("/tasks/1")
         data = response.json()
 
         # Verify all expected fields exist
-        required_fields = [
-            "task_id",
-            "title",
-            "description",
-            "status",
-            "priority",
-            "created_at"
-        ]
-        for field in required_fields:
-            assert field in data, f"Required field '{field}' missing"
+        missing = TASK_FIELDS - data.keys()
+        assert not missing, f"Required fields {sorted(missing)} missing"
 
         # Verify field types
         assert isinstance(data["task_id"], int)
@@ -125,22 +175,32 @@ class TestTasksEndpoint:
         assert isinstance(data["priority"], str)
         assert isinstance(data["created_at"], str)
 
-    def test_get_task_with_zero_id(self, client):
+    async def test_get_task_with_zero_id(self, client):
         """GET /tasks/0 should return task with ID 0."""
-        response = client.get("/tasks/0")
+        response = await client.get("/tasks/0")
 
         assert response.status_code == 200
         data = response.json()
         assert data["task_id"] == 0
 
-    def test_get_task_with_negative_id(self, client):
+    async def test_get_task_with_negative_id(self, client):
         """GET /tasks/{negative_id} should work (no validation preventing it)."""
-        response = client.get("/tasks/-1")
+        response = await client.get("/tasks/-1")
 
         assert response.status_code == 200
         data = response.json()
         assert data["task_id"] == -1
 
+    async def test_get_task_with_id_wider_than_64_bits(self, client):
+        """GET /tasks/{huge_id} should serialize integers beyond 64 bits."""
+        task_id = 99999999999999999999
+        response = await client.get(f"/tasks/{task_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["task_id"] == task_id
+        assert data["title"] == f"Task #{task_id}"
+
 
 # ============================================================================
 # TASKS ENDPOINT - ERROR CASES
@@ -149,9 +209,9 @@ class TestTasksEndpoint:
 class TestTasksEndpointErrors:
     """Tests for error cases in GET /tasks/{task_id}."""
 
-    def test_get_task_with_invalid_id_type_string(self, client):
+    async def test_get_task_with_invalid_id_type_string(self, client):
         """GET /tasks/{task_id} should reject non-integer IDs with 422."""
-        response = client.get("/tasks/invalid-id")
+        response = await client.get("/tasks/invalid-id")
 
         assert response.status_code == 422
 
@@ -163,16 +223,16 @@ class TestTasksEndpointErrors:
         assert error["type"] == "int_parsing"
         assert "task_id" in str(error["loc"])
 
-    def test_get_task_with_invalid_id_type_float(self, client):
+    async def test_get_task_with_invalid_id_type_float(self, client):
         """GET /tasks/{task_id} should reject float IDs with 422."""
-        response = client.get("/tasks/123.45")
+        response = await client.get("/tasks/123.45")
 
         assert response.status_code == 422
         assert "detail" in response.json()
 
-    def test_get_task_with_invalid_id_type_uuid(self, client):
+    async def test_get_task_with_invalid_id_type_uuid(self, client):
         """GET /tasks/{task_id} should reject UUID format with 422."""
-        response = client.get("/tasks/550e8400-e29b-41d4-a716-446655440000")
+        response = await client.get("/tasks/550e8400-e29b-41d4-a716-446655440000")
 
         assert response.status_code == 422
         assert "detail" in response.json()
@@ -185,24 +245,24 @@ class TestTasksEndpointErrors:
         " ",
         "12.34.56",
     ])
-    def test_get_task_with_various_invalid_ids(self, client, invalid_id):
+    async def test_get_task_with_various_invalid_ids(self, client, invalid_id):
         """
         GET /tasks/{task_id} should reject various invalid ID formats.
 
         Using parametrize to test multiple invalid inputs efficiently.
         """
-        response = client.get(f"/tasks/{invalid_id}")
+        response = await client.get(f"/tasks/{invalid_id}")
 
         assert response.status_code == 422
         assert "detail" in response.json()
 
-    def test_get_task_with_empty_string_id(self, client):
+    async def test_get_task_with_empty_string_id(self, client):
         """
         GET /tasks/ (empty ID) should return 404.
 
         Empty string creates /tasks/ which doesn't match /tasks/{task_id} pattern.
         """
-        response = client.get("/tasks/")
+        response = await client.get("/tasks/")
 
         # Empty path segment results in different route, returns 404
         assert response.status_code == 404
@@ -216,9 +276,9 @@ class TestSearchEndpoint:
     """Tests for GET /search endpoint."""
 
     @pytest.mark.smoke
-    def test_search_with_required_query_param(self, client):
+    async def test_search_with_required_query_param(self, client):
         """GET /search?q=... should return search results."""
-        response = client.get("/search?q=test")
+        response = await client.get("/search?q=test")
 
         assert response.status_code == 200
 
@@ -229,9 +289,9 @@ class TestSearchEndpoint:
         assert "results" in data
         assert isinstance(data["results"], list)
 
-    def test_search_with_all_parameters(self, client):
+    async def test_search_with_all_parameters(self, client):
         """GET /search with all parameters should apply filters correctly."""
-        response = client.get(
+        response = await client.get(
             "/search?q=fastapi&limit=5&offset=10&status=completed"
         )
 
@@ -243,9 +303,9 @@ class TestSearchEndpoint:
         assert data["filters"]["offset"] == 10
         assert data["filters"]["status"] == "completed"
 
-    def test_search_with_default_limit_and_offset(self, client):
+    async def test_search_with_default_limit_and_offset(self, client):
         """GET /search should use default values for limit and offset."""
-        response = client.get("/search?q=test")
+        response = await client.get("/search?q=test")
 
         assert response.status_code == 200
 
@@ -254,46 +314,56 @@ class TestSearchEndpoint:
         assert data["filters"]["offset"] == 0  # Default offset
         assert data["filters"]["status"] is None  # Optional, not provided
 
-    def test_search_with_custom_limit(self, client):
+    async def test_search_with_custom_limit(self, client):
         """GET /search should accept custom limit values."""
-        for limit in [1, 5, 20, 100]:
-            response = client.get(f"/search?q=test&limit={limit}")
+        limits = [1, 5, 20, 100]
 
+        responses = await asyncio.gather(
+            *(client.get(f"/search?q=test&limit={limit}") for limit in limits)
+        )
+
+        for limit, response in zip(limits, responses):
             assert response.status_code == 200
             data = response.json()
             assert data["filters"]["limit"] == limit
 
-    def test_search_with_custom_offset(self, client):
+    async def test_search_with_custom_offset(self, client):
         """GET /search should accept custom offset values for pagination."""
-        for offset in [0, 10, 50, 100]:
-            response = client.get(f"/search?q=test&offset={offset}")
+        offsets = [0, 10, 50, 100]
+
+        responses = await asyncio.gather(
+            *(client.get(f"/search?q=test&offset={offset}") for offset in offsets)
+        )
 
+        for offset, response in zip(offsets, responses):
             assert response.status_code == 200
             data = response.json()
             assert data["filters"]["offset"] == offset
 
-    def test_search_with_status_filter(self, client):
+    async def test_search_with_status_filter(self, client):
         """GET /search should accept optional status filter."""
         statuses = ["pending", "in_progress", "completed", "cancelled"]
 
-        for status in statuses:
-            response = client.get(f"/search?q=test&status={status}")
+        responses = await asyncio.gather(
+            *(client.get(f"/search?q=test&status={status}") for status in statuses)
+        )
 
+        for status, response in zip(statuses, responses):
             assert response.status_code == 200
             data = response.json()
             assert data["filters"]["status"] == status
 
-    def test_search_without_status_filter(self, client):
+    async def test_search_without_status_filter(self, client):
         """GET /search without status should have null status filter."""
-        response = client.get("/search?q=test")
+        response = await client.get("/search?q=test")
 
         assert response.status_code == 200
         data = response.json()
         assert data["filters"]["status"] is None
 
-    def test_search_results_structure(self, client):
+    async def test_search_results_structure(self, client):
         """GET /search results should have correct structure."""
-        response = client.get("/search?q=test")
+        response = await client.get("/search?q=test")
 
         assert response.status_code == 200
         data = response.json()
@@ -308,10 +378,10 @@ class TestSearchEndpoint:
         assert "status" in result
         assert "relevance_score" in result
 
-    def test_search_query_reflected_in_results(self, client):
+    async def test_search_query_reflected_in_results(self, client):
         """GET /search should reflect query string in results."""
         query = "my special query"
-        response = client.get(f"/search?q={query}")
+        response = await client.get(f"/search?q={query}")
 
         assert response.status_code == 200
         data = response.json()
@@ -321,19 +391,18 @@ class TestSearchEndpoint:
         for result in data["results"]:
             assert query in result["title"]
 
-    def test_search_response_schema_stability(self, client):
+    async def test_search_response_schema_stability(self, client):
         """
         GET /search response schema should be stable for agents.
 
         Agents depend on consistent top-level fields.
         """
-        response = client.get("/search?q=test")
+        response = await client.get("/search?q=test")
         data = response.json()
 
         # Verify all expected top-level fields
-        required_fields = ["query", "filters", "total_results", "results"]
-        for field in required_fields:
-            assert field in data, f"Required field '{field}' missing"
+        missing = SEARCH_FIELDS - data.keys()
+        assert not missing, f"Required fields {sorted(missing)} missing"
 
         # Verify filters structure
         assert "status" in data["filters"]
@@ -354,9 +423,9 @@ class TestSearchEndpoint:
 class TestSearchEndpointErrors:
     """Tests for error cases in GET /search."""
 
-    def test_search_without_query_param(self, client):
+    async def test_search_without_query_param(self, client):
         """GET /search without required 'q' param should return 422."""
-        response = client.get("/search")
+        response = await client.get("/search")
 
         assert response.status_code == 422
 
@@ -368,44 +437,86 @@ class TestSearchEndpointErrors:
         assert error["type"] == "missing"
         assert "q" in str(error["loc"])
 
-    def test_search_with_empty_query(self, client):
+    async def test_search_with_empty_query(self, client):
         """GET /search with empty query string should work (empty string is valid)."""
-        response = client.get("/search?q=")
+        response = await client.get("/search?q=")
 
         # Empty string is a valid string, should return 200
         assert response.status_code == 200
         data = response.json()
         assert data["query"] == ""
 
-    def test_search_with_invalid_limit_type(self, client):
+    async def test_search_with_invalid_limit_type(self, client):
         """GET /search with non-integer limit should return 422."""
-        response = client.get("/search?q=test&limit=invalid")
+        response = await client.get("/search?q=test&limit=invalid")
 
         assert response.status_code == 422
         data = response.json()
         assert "detail" in data
 
-    def test_search_with_invalid_offset_type(self, client):
+    async def test_search_with_invalid_offset_type(self, client):
         """GET /search with non-integer offset should return 422."""
-        response = client.get("/search?q=test&offset=abc")
+        response = await client.get("/search?q=test&offset=abc")
 
         assert response.status_code == 422
         assert "detail" in response.json()
 
-    def test_search_with_negative_limit(self, client):
+    async def test_search_reports_all_invalid_params(self, client):
+        """GET /search should report every invalid parameter in one 422 response."""
+        response = await client.get("/search?limit=x&offset=y")
+
+        assert response.status_code == 422
+
+        errors = response.json()["detail"]
+        assert [error["loc"] for error in errors] == [
+            ["query", "q"],
+            ["query", "limit"],
+            ["query", "offset"],
+        ]
+        assert [error["type"] for error in errors] == [
+            "missing",
+            "int_parsing",
+            "int_parsing",
+        ]
+
+    async def test_search_accepts_integral_float_limit(self, client):
+        """GET /search should coerce limit=5.0 to 5 (pydantic lax int parsing)."""
+        response = await client.get("/search?q=test&limit=5.0")
+
+        assert response.status_code == 200
+        assert response.json()["filters"]["limit"] == 5
+
+    async def test_search_documents_validation_error(self, client):
+        """GET /search should advertise its 422 response in the OpenAPI schema."""
+        response = await client.get("/openapi.json")
+
+        responses = response.json()["paths"]["/search"]["get"]["responses"]
+        assert "422" in responses
+
+    async def test_search_with_negative_limit(self, client):
         """GET /search with negative limit should work (no validation preventing it)."""
-        response = client.get("/search?q=test&limit=-1")
+        response = await client.get("/search?q=test&limit=-1")
 
         # No validation preventing negative values in current implementation
         assert response.status_code == 200
 
-    def test_search_with_negative_offset(self, client):
+    async def test_search_with_negative_offset(self, client):
         """GET /search with negative offset should work (no validation preventing it)."""
-        response = client.get("/search?q=test&offset=-10")
+        response = await client.get("/search?q=test&offset=-10")
 
         # No validation preventing negative values in current implementation
         assert response.status_code == 200
 
+    async def test_search_with_offset_wider_than_64_bits(self, client):
+        """GET /search should serialize offsets (and derived IDs) beyond 64 bits."""
+        offset = 99999999999999999999
+        response = await client.get(f"/search?q=test&offset={offset}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["filters"]["offset"] == offset
+        assert data["results"][0]["task_id"] == offset + 1
+
 
 # ============================================================================
 # PAGINATION CONSISTENCY TESTS (Agent-Specific)
@@ -418,10 +529,10 @@ class TestPaginationConsistency:
     Important for agents that iterate through paginated results.
     """
 
-    def test_pagination_offset_affects_results(self, client):
+    async def test_pagination_offset_affects_results(self, client):
         """Different offsets should return different task IDs."""
-        response1 = client.get("/search?q=test&offset=0")
-        response2 = client.get("/search?q=test&offset=10")
+        response1 = await client.get("/search?q=test&offset=0")
+        response2 = await client.get("/search?q=test&offset=10")
 
         assert response1.status_code == 200
         assert response2.status_code == 200
@@ -430,19 +541,19 @@ class TestPaginationConsistency:
         data2 = response2.json()
 
         # Task IDs should be different
-        ids1 = {result["task_id"] for result in data1["results"]}
-        ids2 = {result["task_id"] for result in data2["results"]}
+        ids1 = tuple(result["task_id"] for result in data1["results"])
+        ids2 = tuple(result["task_id"] for result in data2["results"])
 
         assert ids1 != ids2  # Different pages should have different IDs
 
-    def test_pagination_limit_affects_result_count(self, client):
+    async def test_pagination_limit_affects_result_count(self, client):
         """
         Limit parameter should affect number of results.
 
         Note: In current mock implementation, always returns 2 results.
         This test documents expected behavior for future implementation.
         """
-        response = client.get("/search?q=test&limit=5")
+        response = await client.get("/search?q=test&limit=5")
 
         assert response.status_code == 200
         data = response.json()
@@ -464,7 +575,7 @@ class TestAPIContractStability:
     which would break agents that depend on the API.
     """
 
-    def test_all_endpoints_return_json(self, client):
+    async def test_all_endpoints_return_json(self, client):
         """All endpoints should return JSON content type."""
         endpoints = [
             "/",
@@ -473,11 +584,11 @@ class TestAPIContractStability:
         ]
 
         for endpoint in endpoints:
-            response = client.get(endpoint)
+            response = await client.get(endpoint)
             assert response.status_code == 200
             assert "application/json" in response.headers["content-type"]
 
-    def test_all_endpoints_return_dictionaries(self, client):
+    async def test_all_endpoints_return_dictionaries(self, client):
         """
         All endpoints should return dictionaries (never None or primitives).
 
@@ -490,29 +601,185 @@ class TestAPIContractStability:
         ]
 
         for endpoint in endpoints:
-            response = client.get(endpoint)
+            response = await client.get(endpoint)
             assert response.status_code == 200
             data = response.json()
             assert isinstance(data, dict), f"Endpoint {endpoint} didn't return dict"
             assert data is not None, f"Endpoint {endpoint} returned None"
 
-    def test_error_responses_have_consistent_format(self, client):
+    async def test_error_responses_have_consistent_format(self, client):
         """
         Error responses should have consistent 'detail' field.
 
         Agents need predictable error formats.
         """
         # Test 422 validation error
-        response = client.get("/tasks/invalid")
+        response = await client.get("/tasks/invalid")
         assert response.status_code == 422
         assert "detail" in response.json()
 
         # Test missing required parameter
-        response = client.get("/search")
+        response = await client.get("/search")
         assert response.status_code == 422
         assert "detail" in response.json()
 
 
+# ============================================================================
+# CONDITIONAL REQUEST TESTS (ETag / 304)
+# ============================================================================
+
+class TestConditionalRequests:
+    """
+    Tests for ETag / If-None-Match handling on deterministic endpoints.
+
+    Agents polling the same resource can revalidate without re-downloading it.
+    """
+
+    @pytest.mark.parametrize("endpoint", ["/", "/tasks/1"])
+    async def test_response_includes_etag(self, client, endpoint):
+        """Deterministic endpoints should return a weak, quoted ETag header."""
+        response = await client.get(endpoint)
+
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"') and etag.endswith('"')
+
+    @pytest.mark.parametrize("endpoint", ["/", "/tasks/1"])
+    async def test_etag_is_stable_across_requests(self, client, endpoint):
+        """Same resource should always produce the same ETag."""
+        response1 = await client.get(endpoint)
+        response2 = await client.get(endpoint)
+
+        assert response1.headers["etag"] == response2.headers["etag"]
+
+    async def test_etag_differs_between_tasks(self, client):
+        """Different task IDs should have different ETags."""
+        response1 = await client.get("/tasks/1")
+        response2 = await client.get("/tasks/2")
+
+        assert response1.headers["etag"] != response2.headers["etag"]
+
+    @pytest.mark.parametrize("endpoint", ["/", "/tasks/1"])
+    async def test_matching_if_none_match_returns_304(self, client, endpoint):
+        """A matching If-None-Match should return 304 with an empty body."""
+        etag = (await client.get(endpoint)).headers["etag"]
+
+        response = await client.get(endpoint, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    async def test_if_none_match_list_and_strong_form(self, client):
+        """If-None-Match should match any tag in a list, weak or strong form."""
+        etag = (await client.get("/")).headers["etag"]
+        strong_form = etag.removeprefix("W/")
+
+        response = await client.get(
+            "/", headers={"If-None-Match": f'"stale", {strong_form}'}
+        )
+
+        assert response.status_code == 304
+
+    async def test_stale_if_none_match_returns_full_response(self, client):
+        """A non-matching If-None-Match should return the full 200 response."""
+        response = await client.get("/tasks/1", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json()["task_id"] == 1
+
+
+# ============================================================================
+# CACHE-CONTROL TESTS
+# ============================================================================
+
+class TestCacheControl:
+    """Tests for Cache-Control headers on deterministic endpoints."""
+
+    @pytest.mark.parametrize("endpoint,max_age", [
+        ("/", 60),
+        ("/tasks/1", 300),
+        ("/search?q=test", 60),
+    ])
+    async def test_endpoint_is_publicly_cacheable(self, client, endpoint, max_age):
+        """Deterministic endpoints should allow shared caches to store them."""
+        response = await client.get(endpoint)
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == f"public, max-age={max_age}"
+
+    async def test_not_modified_keeps_cache_control(self, client):
+        """304 responses should refresh the cache lifetime too."""
+        etag = (await client.get("/tasks/1")).headers["etag"]
+
+        response = await client.get("/tasks/1", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == "public, max-age=300"
+
+    async def test_error_responses_are_not_cached(self, client):
+        """Validation errors should not be marked cacheable."""
+        response = await client.get("/tasks/invalid")
+
+        assert response.status_code == 422
+        assert "cache-control" not in response.headers
+
+
+# ============================================================================
+# COMPRESSION TESTS
+# ============================================================================
+
+class TestCompression:
+    """Tests for gzip compression of large responses."""
+
+    async def test_large_search_response_is_gzipped(self, client):
+        """Search responses above the size threshold should be gzip-encoded."""
+        query = "x" * 300
+        response = await client.get(
+            f"/search?q={query}", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["query"] == query
+
+    async def test_gzipped_response_has_weak_etag(self, client):
+        """
+        A gzip-encoded body must not reuse a strong ETag from the identity body.
+
+        A ~150-digit task ID pushes /tasks/{task_id} over the gzip threshold.
+        """
+        task_id = "9" * 150
+        gzipped = await client.get(
+            f"/tasks/{task_id}", headers={"Accept-Encoding": "gzip"}
+        )
+        identity = await client.get(
+            f"/tasks/{task_id}", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in identity.headers
+        assert gzipped.headers["etag"].startswith("W/")
+        assert identity.headers["etag"].startswith("W/")
+
+    async def test_small_response_is_not_compressed(self, client):
+        """Responses below the size threshold should be sent uncompressed."""
+        response = await client.get("/tasks/1", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    async def test_no_compression_without_accept_encoding(self, client):
+        """Clients that don't accept gzip should get an uncompressed body."""
+        query = "x" * 300
+        response = await client.get(
+            f"/search?q={query}", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
@@ -521,38 +788,38 @@ class TestAPIContractStability:
 class TestAPIIntegration:
     """Integration tests for complete workflows."""
 
-    def test_complete_search_workflow(self, client):
+    async def test_complete_search_workflow(self, client):
         """Test complete search workflow: query -> paginate -> filter."""
         # Step 1: Search with query
-        response1 = client.get("/search?q=project")
+        response1 = await client.get("/search?q=project")
         assert response1.status_code == 200
         data1 = response1.json()
         assert data1["query"] == "project"
 
         # Step 2: Paginate to next page
-        response2 = client.get("/search?q=project&offset=10")
+        response2 = await client.get("/search?q=project&offset=10")
         assert response2.status_code == 200
         data2 = response2.json()
         assert data2["filters"]["offset"] == 10
 
         # Step 3: Filter by status
-        response3 = client.get("/search?q=project&status=completed")
+        response3 = await client.get("/search?q=project&status=completed")
         assert response3.status_code == 200
         data3 = response3.json()
         assert data3["filters"]["status"] == "completed"
 
-    def test_api_discovery_workflow(self, client):
+    async def test_api_discovery_workflow(self, client):
         """Test API discovery: root -> docs -> specific endpoints."""
         # Step 1: Get root information
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["docs"] == "/docs"
 
         # Step 2: Access tasks endpoint
-        response = client.get("/tasks/1")
+        response = await client.get("/tasks/1")
         assert response.status_code == 200
 
         # Step 3: Use search endpoint
-        response = client.get("/search?q=test")
+        response = await client.get("/search?q=test")
         assert response.status_code == 200